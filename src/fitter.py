@@ -29,6 +29,10 @@ class Fitter:
 
     def fit(self, freqs: np.ndarray, amps: np.ndarray, phases: np.ndarray, manual_init=None, verbose=False):
         """Fit resonator data using the provided method using lmfit's Monte Carlo."""
+        # Coerce inputs up front so list inputs work and later steps stay vectorized
+        freqs = np.ascontiguousarray(freqs, dtype=np.float64)
+        amps = np.ascontiguousarray(amps, dtype=np.float64)
+        phases = np.ascontiguousarray(phases, dtype=np.float64)
         linear_amps = 10 ** (amps / 20)
         phases = np.unwrap(phases)
         xdata, ydata = freqs, np.multiply(linear_amps, np.exp(1j * phases))
@@ -256,22 +260,22 @@ class Fitter:
         """Refines initial parameter estimates using sequential fitting."""
 
         def residuals_Ql(Ql):
-            return np.array(self._phase_residuals(f_data, phase, fr=fr_guess, Ql=Ql, theta=theta_guess, delay=delay_guess), dtype=np.float64)
+            return self._phase_residuals(f_data, phase, fr=fr_guess, Ql=Ql, theta=theta_guess, delay=delay_guess)
 
         def residuals_fr_theta(params):
             fr, theta = params
-            return np.array(self._phase_residuals(f_data, phase, fr=fr, Ql=Ql_guess, theta=theta, delay=delay_guess), dtype=np.float64)
+            return self._phase_residuals(f_data, phase, fr=fr, Ql=Ql_guess, theta=theta, delay=delay_guess)
 
         def residuals_delay(delay):
-            return np.array(self._phase_residuals(f_data, phase, fr=fr_guess, Ql=Ql_guess, theta=theta_guess, delay=delay), dtype=np.float64)
+            return self._phase_residuals(f_data, phase, fr=fr_guess, Ql=Ql_guess, theta=theta_guess, delay=delay)
 
         def residuals_fr_Ql(params):
             fr, Ql = params
-            return np.array(self._phase_residuals(f_data, phase, fr=fr, Ql=Ql, theta=theta_guess, delay=delay_guess), dtype=np.float64)
+            return self._phase_residuals(f_data, phase, fr=fr, Ql=Ql, theta=theta_guess, delay=delay_guess)
         
         def residuals_final(params):
             fr, Ql, theta, delay = params
-            return np.array(self._phase_residuals(f_data, phase, fr=fr, Ql=Ql, theta=theta, delay=delay), dtype=np.float64)
+            return self._phase_residuals(f_data, phase, fr=fr, Ql=Ql, theta=theta, delay=delay)
 
         # Ensure the initial guesses are float arrays
         initial_guesses = np.array([fr_guess, Ql_guess], dtype=np.float64)
@@ -314,8 +318,9 @@ class Fitter:
         # Compute the phase difference as residuals
         residuals = phase_dist(phase - model_phase)
 
-        # Ensure the residuals are returned as a numpy array of type float
-        return residuals.astype(np.float64)
+        # Ensure the residuals are returned as a numpy array of type float,
+        # without copying when they already are
+        return np.asarray(residuals, dtype=np.float64)
 
 
     